@@ -1,9 +1,14 @@
+import threading
+from datetime import datetime, timezone
+
 from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
 from pydantic import ValidationError
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
-from models import TaskCreate, TaskResponse, StatsResponse
+from due_index import DueIndex
+from jobs import JobManager
+from models import TaskCreate, TaskResponse, StatsResponse, TaskFilter, JobResponse, UpcomingQuery
 
 app = Flask(__name__)
 CORS(app)
@@ -11,12 +16,119 @@ CORS(app)
 # In-memory storage
 tasks = {}
 next_id = 1
+tasks_lock = threading.Lock()
+
+# Maintained on every mutation so stats and due-date queries never scan tasks
+completed_count = 0
+due_index = DueIndex()
+
+# Worker pool for predicate-based bulk operations
+jobs = JobManager()
+
+
+def validation_error_response(message: str, e: ValidationError) -> Tuple[Response, int]:
+    """Convert Pydantic errors to a JSON-serializable 400 response"""
+    error_details = []
+    for error in e.errors():
+        error_details.append({
+            'field': '.'.join(str(x) for x in error['loc']),
+            'message': error['msg'],
+            'type': error['type']
+        })
+    return jsonify({'error': message, 'details': error_details}), 400
+
+
+def mark_completed(task: dict) -> bool:
+    """Complete a stored task, returning False if it already was (caller holds tasks_lock)"""
+    global completed_count
+
+    if task['completed']:
+        return False
+
+    task['completed'] = True
+    completed_count += 1
+    if task['due_at'] is not None:
+        due_index.remove(task['due_at'], task['id'])
+    return True
+
+
+def remove_task(task_id: int) -> dict:
+    """Delete a stored task and return it (caller holds tasks_lock)"""
+    global completed_count
+
+    task = tasks.pop(task_id)
+    if task['completed']:
+        completed_count -= 1
+    elif task['due_at'] is not None:
+        due_index.remove(task['due_at'], task['id'])
+    return task
+
+
+def start_bulk_job(operation: str) -> Tuple[Response, int]:
+    """Queue a bulk operation over every task matching the query-string filter"""
+    repeated = sorted(key for key, values in request.args.to_dict(flat=False).items() if len(values) > 1)
+    if repeated:
+        return jsonify({'error': f"Filter given more than once: {', '.join(repeated)}"}), 400
+
+    try:
+        task_filter = TaskFilter(**request.args.to_dict())
+    except ValidationError as e:
+        return validation_error_response('Task filter validation failed', e)
+
+    if task_filter.is_empty():
+        return jsonify({'error': 'At least one filter is required'}), 400
+
+    def apply_chunk(chunk: List[int]) -> List[int]:
+        affected = []
+        with tasks_lock:
+            for task_id in chunk:
+                task = tasks.get(task_id)
+                # Re-check the filter: the task may have changed since the snapshot
+                if task is None or not task_filter.matches(task):
+                    continue
+                if operation == 'delete':
+                    remove_task(task_id)
+                elif not mark_completed(task):
+                    continue
+                affected.append(task_id)
+        return affected
+
+    def snapshot() -> List[int]:
+        with tasks_lock:
+            return list(tasks)
+
+    job = jobs.submit(operation, snapshot, apply_chunk)
+    return jsonify(JobResponse(**job).model_dump()), 202
 
 
 @app.route('/tasks', methods=['GET'])
 def get_tasks() -> Tuple[Response, int]:
     """List all tasks"""
-    task_list = [TaskResponse(**task).model_dump() for task in tasks.values()]
+    with tasks_lock:
+        task_list = [TaskResponse(**task).model_dump(mode='json') for task in tasks.values()]
+    return jsonify(task_list), 200
+
+
+@app.route('/tasks/overdue', methods=['GET'])
+def get_overdue_tasks() -> Tuple[Response, int]:
+    """List pending tasks past their due date, oldest first"""
+    with tasks_lock:
+        task_ids = due_index.overdue(datetime.now(timezone.utc))
+        task_list = [TaskResponse(**tasks[task_id]).model_dump(mode='json') for task_id in task_ids]
+    return jsonify(task_list), 200
+
+
+@app.route('/tasks/upcoming', methods=['GET'])
+def get_upcoming_tasks() -> Tuple[Response, int]:
+    """List pending tasks due within a time window, soonest first"""
+    try:
+        query = UpcomingQuery(**request.args.to_dict())
+    except ValidationError as e:
+        return validation_error_response('Query validation failed', e)
+
+    with tasks_lock:
+        task_ids = due_index.upcoming(datetime.now(timezone.utc), query.within)
+        task_list = [TaskResponse(**tasks[task_id]).model_dump(mode='json') for task_id in task_ids]
     return jsonify(task_list), 200
 
 
@@ -33,65 +145,88 @@ def create_task() -> Tuple[Response, int]:
     try:
         task_create = TaskCreate(**data)
 
-        # Create task dict
-        task = {
-            'id': next_id,
-            'title': task_create.title,
-            'completed': False
-        }
+        with tasks_lock:
+            # Create task dict
+            task = {
+                'id': next_id,
+                'title': task_create.title,
+                'completed': False,
+                'due_at': task_create.due_at
+            }
 
-        tasks[next_id] = task
-        next_id += 1
+            tasks[next_id] = task
+            if task['due_at'] is not None:
+                due_index.add(task['due_at'], next_id)
+            next_id += 1
 
         # Return validated response
         task_response = TaskResponse(**task)
-        return jsonify(task_response.model_dump()), 201
+        return jsonify(task_response.model_dump(mode='json')), 201
 
     except ValidationError as e:
-        # Convert Pydantic errors to JSON-serializable format
-        error_details = []
-        for error in e.errors():
-            error_details.append({
-                'field': '.'.join(str(x) for x in error['loc']),
-                'message': error['msg'],
-                'type': error['type']
-            })
-        return jsonify({'error': 'Task validation failed', 'details': error_details}), 400
+        return validation_error_response('Task validation failed', e)
 
 
 @app.route('/tasks/<int:task_id>/complete', methods=['PUT'])
 def complete_task(task_id: int) -> Tuple[Response, int]:
     """Mark a task as completed"""
-    if task_id not in tasks:
-        return jsonify({'error': 'Task not found'}), 404
+    with tasks_lock:
+        if task_id not in tasks:
+            return jsonify({'error': 'Task not found'}), 404
 
-    tasks[task_id]['completed'] = True
-    task_response = TaskResponse(**tasks[task_id])
-    return jsonify(task_response.model_dump()), 200
+        mark_completed(tasks[task_id])
+        task_response = TaskResponse(**tasks[task_id])
+    return jsonify(task_response.model_dump(mode='json')), 200
 
 
 @app.route('/tasks/<int:task_id>', methods=['DELETE'])
 def delete_task(task_id: int) -> Tuple[Response, int]:
     """Delete a task"""
-    if task_id not in tasks:
-        return jsonify({'error': 'Task not found'}), 404
+    with tasks_lock:
+        if task_id not in tasks:
+            return jsonify({'error': 'Task not found'}), 404
 
-    deleted_task = tasks.pop(task_id)
+        deleted_task = remove_task(task_id)
     task_response = TaskResponse(**deleted_task)
-    return jsonify(task_response.model_dump()), 200
+    return jsonify(task_response.model_dump(mode='json')), 200
+
+
+@app.route('/tasks', methods=['DELETE'])
+def delete_tasks() -> Tuple[Response, int]:
+    """Delete all tasks matching a filter in a background job"""
+    return start_bulk_job('delete')
+
+
+@app.route('/tasks/complete', methods=['PUT'])
+def complete_tasks() -> Tuple[Response, int]:
+    """Mark all tasks matching a filter as completed in a background job"""
+    return start_bulk_job('complete')
+
+
+@app.route('/jobs/<int:job_id>', methods=['GET'])
+def get_job(job_id: int) -> Tuple[Response, int]:
+    """Get progress and results of a background job"""
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+
+    return jsonify(JobResponse(**job).model_dump()), 200
 
 
 @app.route('/tasks/stats', methods=['GET'])
 def get_stats() -> Tuple[Response, int]:
     """Get task statistics"""
-    total = len(tasks)
-    completed = sum(1 for task in tasks.values() if task['completed'])
+    with tasks_lock:
+        total = len(tasks)
+        completed = completed_count
+        overdue = due_index.overdue_count(datetime.now(timezone.utc))
     pending = total - completed
 
     stats_response = StatsResponse(
         total=total,
         completed=completed,
-        pending=pending
+        pending=pending,
+        overdue=overdue
     )
 
     return jsonify(stats_response.model_dump()), 200
@@ -0,0 +1,34 @@
+"""
+ASGI entry point serving the Flask app from an asyncio event loop.
+
+Connections are owned by the event loop, so idle keep-alive, polling and
+streaming clients cost a socket and a small protocol object rather than a
+thread each. Requests run through the same Flask routes and pydantic models
+as the threaded WSGI server, and store access is still guarded by
+``tasks_lock``, which bulk-job workers share.
+
+The trade-off is that the adapter runs every request on one shared thread.
+Store work never blocks the loop, but a slow request (a large ``GET
+/tasks``, or a wait on ``tasks_lock`` behind a bulk-job chunk) delays every
+other request queued behind it. This mode buys cheap idle connections, not
+more parallel request handling.
+"""
+import os
+
+from asgiref.wsgi import WsgiToAsgi
+
+from app import app
+
+asgi_app = WsgiToAsgi(app)
+
+
+if __name__ == '__main__':
+    import uvicorn
+
+    uvicorn.run(
+        asgi_app,
+        host='0.0.0.0',
+        port=int(os.environ.get('PORT', 5000)),
+        backlog=int(os.environ.get('BACKLOG', 4096)),
+        timeout_keep_alive=int(os.environ.get('KEEP_ALIVE_TIMEOUT', 75))
+    )
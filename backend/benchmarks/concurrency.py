@@ -0,0 +1,183 @@
+"""
+Compare concurrency headroom of the threaded WSGI and ASGI serving modes.
+
+For each mode a server is started in a subprocess and seeded with tasks.
+Then a number of idle connections are opened and held (each has sent a
+partial request, like a slow or long-polling client). While they are held:
+
+- the server's thread count and resident memory are sampled,
+- foreground requests are timed one at a time (latency with idle load),
+- the same number of requests is sent with many in flight at once
+  (throughput and latency under concurrent active load).
+
+The ASGI server is started through ``asgi.py`` so it runs with the shipped
+settings. The WSGI server runs ``app.run`` threaded without the debug
+reloader, so a single process is measured.
+
+Usage:
+    python benchmarks/concurrency.py [--idle 2000] [--requests 200] [--concurrency 50] [--seed 1000]
+"""
+import argparse
+import asyncio
+import os
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+SERVERS = {
+    'wsgi': [sys.executable, '-c',
+             "import os; from app import app; app.run(host='127.0.0.1', port=int(os.environ['PORT']), threaded=True)"],
+    'asgi': [sys.executable, 'asgi.py'],
+}
+
+
+def free_port() -> int:
+    """Ask the OS for an unused TCP port."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def process_status(pid: int) -> Dict[str, int]:
+    """Read thread count and resident memory (KiB) of a process from /proc."""
+    status = {}
+    with open(f'/proc/{pid}/status') as f:
+        for line in f:
+            key, _, value = line.partition(':')
+            if key in ('Threads', 'VmRSS'):
+                status[key] = int(value.split()[0])
+    return status
+
+
+async def http_request(port: int, path: str, method: str = 'GET', body: bytes = b'') -> float:
+    """Issue one request on a fresh connection and return its latency in ms."""
+    start = time.perf_counter()
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    headers = f'{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n'
+    if body:
+        headers += f'Content-Type: application/json\r\nContent-Length: {len(body)}\r\n'
+    writer.write(headers.encode() + b'\r\n' + body)
+    await writer.drain()
+    await reader.read()
+    writer.close()
+    return (time.perf_counter() - start) * 1000
+
+
+async def wait_until_ready(port: int, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            await http_request(port, '/tasks/stats')
+            return
+        except OSError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError(f'Server on port {port} did not start')
+
+
+async def open_idle(port: int, count: int) -> List[asyncio.StreamWriter]:
+    """Open connections that send request headers but never finish them."""
+    writers = []
+    for _ in range(count):
+        try:
+            _, writer = await asyncio.open_connection('127.0.0.1', port)
+        except OSError:
+            break
+        writer.write(b'GET /tasks HTTP/1.1\r\nHost: localhost\r\n')
+        writers.append(writer)
+    await asyncio.gather(*(w.drain() for w in writers), return_exceptions=True)
+    return writers
+
+
+async def timed_requests(port: int, count: int, concurrency: int) -> Dict[str, float]:
+    """Send ``count`` GETs with up to ``concurrency`` in flight and summarize them."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    failures = 0
+
+    async def one() -> None:
+        nonlocal failures
+        async with semaphore:
+            try:
+                latencies.append(await asyncio.wait_for(http_request(port, '/tasks/stats'), timeout=10.0))
+            except (OSError, asyncio.TimeoutError):
+                failures += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(count)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'rps': len(latencies) / elapsed,
+        'p50 (ms)': statistics.median(latencies) if latencies else float('nan'),
+        'p99 (ms)': latencies[max(int(len(latencies) * 0.99) - 1, 0)] if latencies else float('nan'),
+        'failed': failures,
+    }
+
+
+async def bench(mode: str, idle: int, requests: int, concurrency: int, seed: int) -> Dict[str, float]:
+    port = free_port()
+    server = subprocess.Popen(
+        SERVERS[mode], cwd=BACKEND_DIR, env={**os.environ, 'PORT': str(port)},
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        await wait_until_ready(port)
+        for i in range(seed):
+            await http_request(port, '/tasks', 'POST', f'{{"title": "Task {i}"}}'.encode())
+        baseline = process_status(server.pid)
+
+        writers = await open_idle(port, idle)
+        # Give the server time to accept the connections
+        await asyncio.sleep(1.0)
+        loaded = process_status(server.pid)
+
+        sequential = await timed_requests(port, requests, 1)
+        concurrent = await timed_requests(port, requests, concurrency)
+
+        for writer in writers:
+            writer.close()
+    finally:
+        server.terminate()
+        server.wait()
+
+    return {
+        'idle connections': len(writers),
+        'threads': loaded['Threads'],
+        'rss delta (MiB)': (loaded['VmRSS'] - baseline['VmRSS']) / 1024,
+        **{f'seq {key}': value for key, value in sequential.items()},
+        **{f'conc {key}': value for key, value in concurrent.items()},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--idle', type=int, default=2000, help='idle connections to hold open')
+    parser.add_argument('--requests', type=int, default=200, help='foreground requests to time per phase')
+    parser.add_argument('--concurrency', type=int, default=50, help='requests in flight in the concurrent phase')
+    parser.add_argument('--seed', type=int, default=1000, help='tasks to create before measuring')
+    parser.add_argument('--modes', nargs='+', default=list(SERVERS), choices=list(SERVERS))
+    args = parser.parse_args()
+
+    # Each idle connection needs a file descriptor on both ends
+    _, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+    results = {mode: asyncio.run(bench(mode, args.idle, args.requests, args.concurrency, args.seed))
+               for mode in args.modes}
+
+    metrics = list(next(iter(results.values())))
+    print(f"{'':<20}" + ''.join(f'{mode:>12}' for mode in results))
+    for metric in metrics:
+        values = (results[mode][metric] for mode in results)
+        print(f'{metric:<20}' + ''.join(f'{v:>12.1f}' if isinstance(v, float) else f'{v:>12}' for v in values))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+Time-ordered index of pending tasks by due date.
+"""
+import math
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta, timezone
+from itertools import chain, islice
+from typing import Iterator, List, Optional, Tuple
+
+Entry = Tuple[datetime, int]
+
+
+class DueIndex:
+    """Sorted (due_at, task_id) entries for pending tasks that have a due date.
+
+    Entries are stored in consecutive sorted blocks of at most ``2 * load``
+    entries, with ``_maxes`` holding the last entry of each block. Adding or
+    removing a task bisects ``_maxes`` and shifts within one block, so its
+    cost is bounded by the block size rather than the number of tasks, and a
+    bulk job touching n tasks stays linear overall.
+
+    ``_overdue`` counts entries due at or before ``_as_of``. Because time
+    only moves forward, each entry crosses that point once, so keeping the
+    overdue count current is amortized O(1) per query rather than a scan.
+    Callers must hold the store lock.
+    """
+
+    def __init__(self, load: int = 500) -> None:
+        self._load = load
+        self._blocks: List[List[Entry]] = []
+        self._maxes: List[Entry] = []
+        self._overdue = 0
+        self._as_of: Optional[datetime] = None
+
+    def add(self, due_at: datetime, task_id: int) -> None:
+        """Index a pending task."""
+        entry = (due_at, task_id)
+        if not self._blocks:
+            self._blocks.append([entry])
+            self._maxes.append(entry)
+        else:
+            i = min(bisect_left(self._maxes, entry), len(self._maxes) - 1)
+            block = self._blocks[i]
+            insort(block, entry)
+            self._maxes[i] = block[-1]
+            if len(block) > 2 * self._load:
+                # Split an oversized block in two to keep shifts cheap
+                self._blocks[i:i + 1] = [block[:self._load], block[self._load:]]
+                self._maxes[i:i + 1] = [block[self._load - 1], block[-1]]
+
+        if self._as_of is not None and due_at <= self._as_of:
+            self._overdue += 1
+
+    def remove(self, due_at: datetime, task_id: int) -> None:
+        """Drop a task that was completed or deleted."""
+        entry = (due_at, task_id)
+        i = bisect_left(self._maxes, entry)
+        if i == len(self._maxes):
+            return
+        block = self._blocks[i]
+        j = bisect_left(block, entry)
+        if j == len(block) or block[j] != entry:
+            return
+
+        del block[j]
+        if block:
+            self._maxes[i] = block[-1]
+        else:
+            del self._blocks[i]
+            del self._maxes[i]
+
+        if self._as_of is not None and due_at <= self._as_of:
+            self._overdue -= 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._blocks.clear()
+        self._maxes.clear()
+        self._overdue = 0
+        self._as_of = None
+
+    def overdue_count(self, now: datetime) -> int:
+        """Number of pending tasks due at or before ``now``."""
+        self._advance(now)
+        return self._overdue
+
+    def overdue(self, now: datetime) -> List[int]:
+        """IDs of pending tasks due at or before ``now``, oldest first."""
+        self._advance(now)
+        return [task_id for _, task_id in islice(chain.from_iterable(self._blocks), self._overdue)]
+
+    def upcoming(self, now: datetime, within: timedelta) -> List[int]:
+        """IDs of pending tasks due after ``now`` and within ``within``, soonest first."""
+        self._advance(now)
+        try:
+            limit = now + within
+        except OverflowError:
+            # Windows reaching past year 9999 cover every remaining entry
+            limit = datetime.max.replace(tzinfo=timezone.utc)
+
+        task_ids = []
+        for due_at, task_id in self._iter_after(now):
+            if due_at > limit:
+                break
+            task_ids.append(task_id)
+        return task_ids
+
+    def _iter_after(self, when: datetime) -> Iterator[Entry]:
+        """Yield entries due strictly after ``when``, in order."""
+        key = (when, math.inf)
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return
+        block = self._blocks[i]
+        yield from block[bisect_left(block, key):]
+        for block in self._blocks[i + 1:]:
+            yield from block
+
+    def _advance(self, now: datetime) -> None:
+        if self._as_of is None or now < self._as_of:
+            # First query, or the clock went backwards: count up to ``now`` directly
+            key = (now, math.inf)
+            i = bisect_left(self._maxes, key)
+            self._overdue = sum(len(block) for block in self._blocks[:i])
+            if i < len(self._blocks):
+                self._overdue += bisect_left(self._blocks[i], key)
+        else:
+            for due_at, _ in self._iter_after(self._as_of):
+                if due_at > now:
+                    break
+                self._overdue += 1
+        self._as_of = now
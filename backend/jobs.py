@@ -0,0 +1,105 @@
+"""
+Background job runner for bulk task operations.
+"""
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+
+class JobManager:
+    """Run bulk operations on a worker pool and track their progress.
+
+    Each job takes a snapshot of task IDs on the worker, then walks it in
+    fixed-size chunks. The chunk callback is responsible for taking the
+    store lock, so the lock is only held for one chunk at a time and
+    foreground requests can interleave. Each job counts every affected task
+    but records at most ``max_task_ids`` of their IDs, so polling stays cheap
+    and memory is bounded; only the most recent ``max_finished`` finished
+    jobs are kept.
+    """
+
+    def __init__(self, max_workers: int = 2, chunk_size: int = 100,
+                 max_finished: int = 100, max_task_ids: int = 1000) -> None:
+        self.chunk_size = chunk_size
+        self.max_finished = max_finished
+        self.max_task_ids = max_task_ids
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='bulk-job')
+        self._lock = threading.Lock()
+        self._jobs: Dict[int, dict] = {}
+        self._finished: deque = deque()
+        self._next_id = 1
+
+    def submit(self, operation: str, snapshot: Callable[[], List[int]],
+               apply_chunk: Callable[[List[int]], List[int]]) -> dict:
+        """Queue a job and return a copy of its initial state."""
+        with self._lock:
+            job = {
+                'id': self._next_id,
+                'operation': operation,
+                'status': 'pending',
+                'total': 0,
+                'processed': 0,
+                'affected': 0,
+                'task_ids': [],
+                'error': None
+            }
+            self._jobs[self._next_id] = job
+            self._next_id += 1
+            initial = self._copy(job)
+
+        self._executor.submit(self._run, job, snapshot, apply_chunk)
+        return initial
+
+    def get(self, job_id: int) -> Optional[dict]:
+        """Return a snapshot of a job, or None if it does not exist."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return self._copy(job) if job is not None else None
+
+    def clear(self) -> None:
+        """Forget all jobs and restart job numbering."""
+        with self._lock:
+            self._jobs.clear()
+            self._finished.clear()
+            self._next_id = 1
+
+    def _run(self, job: dict, snapshot: Callable[[], List[int]],
+             apply_chunk: Callable[[List[int]], List[int]]) -> None:
+        with self._lock:
+            job['status'] = 'running'
+
+        try:
+            task_ids = snapshot()
+            with self._lock:
+                job['total'] = len(task_ids)
+
+            for start in range(0, len(task_ids), self.chunk_size):
+                chunk = task_ids[start:start + self.chunk_size]
+                affected = apply_chunk(chunk)
+                with self._lock:
+                    job['processed'] += len(chunk)
+                    job['affected'] += len(affected)
+                    room = self.max_task_ids - len(job['task_ids'])
+                    if room > 0:
+                        job['task_ids'].extend(affected[:room])
+        except Exception as e:
+            self._finish(job, 'failed', str(e))
+            return
+
+        self._finish(job, 'completed')
+
+    def _finish(self, job: dict, status: str, error: Optional[str] = None) -> None:
+        with self._lock:
+            job['status'] = status
+            job['error'] = error
+            # clear() may have dropped this job while it was running
+            if self._jobs.get(job['id']) is not job:
+                return
+            self._finished.append(job['id'])
+            while len(self._finished) > self.max_finished:
+                self._jobs.pop(self._finished.popleft(), None)
+
+    @staticmethod
+    def _copy(job: dict) -> dict:
+        return {**job, 'task_ids': list(job['task_ids'])}
@@ -1,12 +1,16 @@
 """
 Pydantic models for request/response validation.
 """
+from datetime import datetime, timedelta, timezone
+from typing import List, Literal, Optional
+
 from pydantic import BaseModel, Field, field_validator
 
 
 class TaskCreate(BaseModel):
     """Model for creating a new task."""
     title: str = Field(..., min_length=1, max_length=200, description="Task title")
+    due_at: Optional[datetime] = Field(None, description="When the task is due (UTC if no offset given)")
 
     @field_validator('title')
     @classmethod
@@ -22,12 +26,26 @@ class TaskCreate(BaseModel):
             raise ValueError('Title cannot be empty or whitespace only')
         return v
 
+    @field_validator('due_at')
+    @classmethod
+    def normalize_to_utc(cls, v: Optional[datetime]) -> Optional[datetime]:
+        """Store due dates as timezone-aware UTC so they can be compared."""
+        if v is None:
+            return v
+        if v.tzinfo is None:
+            return v.replace(tzinfo=timezone.utc)
+        try:
+            return v.astimezone(timezone.utc)
+        except OverflowError:
+            raise ValueError('due_at is out of range')
+
 
 class TaskResponse(BaseModel):
     """Model for task responses."""
     id: int = Field(..., description="Task ID")
     title: str = Field(..., description="Task title")
     completed: bool = Field(..., description="Task completion status")
+    due_at: Optional[datetime] = Field(None, description="When the task is due")
 
     model_config = {"from_attributes": True}
 
@@ -37,3 +55,55 @@ class StatsResponse(BaseModel):
     total: int = Field(..., ge=0, description="Total number of tasks")
     completed: int = Field(..., ge=0, description="Number of completed tasks")
     pending: int = Field(..., ge=0, description="Number of pending tasks")
+    overdue: int = Field(..., ge=0, description="Number of pending tasks past their due date")
+
+
+class UpcomingQuery(BaseModel):
+    """Model for the upcoming tasks query window."""
+    within: timedelta = Field(timedelta(days=1), gt=timedelta(0),
+                              description="Look-ahead window, in seconds or as an ISO 8601 duration")
+
+    @field_validator('within', mode='before')
+    @classmethod
+    def parse_seconds(cls, v):
+        """Accept a plain number of seconds from the query string."""
+        if isinstance(v, str):
+            try:
+                return float(v)
+            except ValueError:
+                return v
+        return v
+
+
+class TaskFilter(BaseModel):
+    """Model for predicates selecting tasks in bulk operations."""
+    completed: Optional[bool] = Field(None, description="Match on completion status")
+    title: Optional[str] = Field(None, min_length=1, max_length=200,
+                                 description="Case-insensitive substring of the task title")
+
+    # Reject misspelled filters rather than widening a destructive operation
+    model_config = {"extra": "forbid"}
+
+    def is_empty(self) -> bool:
+        """Return True if no predicate was given."""
+        return self.completed is None and self.title is None
+
+    def matches(self, task: dict) -> bool:
+        """Check whether a stored task satisfies every given predicate."""
+        if self.completed is not None and task['completed'] != self.completed:
+            return False
+        if self.title is not None and self.title.lower() not in task['title'].lower():
+            return False
+        return True
+
+
+class JobResponse(BaseModel):
+    """Model for background job responses."""
+    id: int = Field(..., description="Job ID")
+    operation: Literal['delete', 'complete'] = Field(..., description="Bulk operation being applied")
+    status: Literal['pending', 'running', 'completed', 'failed'] = Field(..., description="Job status")
+    total: int = Field(..., ge=0, description="Number of tasks to examine, known once the job is running")
+    processed: int = Field(..., ge=0, description="Number of tasks examined so far")
+    affected: int = Field(..., ge=0, description="Number of tasks affected so far")
+    task_ids: List[int] = Field(..., description="IDs of affected tasks, capped at the first 1000")
+    error: Optional[str] = Field(None, description="Failure reason, if the job failed")
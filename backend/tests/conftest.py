@@ -4,6 +4,7 @@ Pytest configuration and fixtures.
 import pytest
 import sys
 import os
+import time
 
 # Add parent directory to path so we can import app and models
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -27,20 +28,26 @@ def client(app):
 @pytest.fixture(autouse=True)
 def reset_tasks():
     """Reset the in-memory task storage before each test."""
-    from app import tasks
+    from app import tasks, jobs, due_index
 
-    # Clear all tasks
+    # Clear all tasks, jobs and the due-date index
     tasks.clear()
+    jobs.clear()
+    due_index.clear()
 
-    # Reset next_id to 1
+    # Reset next_id to 1 and the completed counter to 0
     import app as app_module
     app_module.next_id = 1
+    app_module.completed_count = 0
 
     yield
 
     # Clean up after test
     tasks.clear()
+    jobs.clear()
+    due_index.clear()
     app_module.next_id = 1
+    app_module.completed_count = 0
 
 
 @pytest.fixture
@@ -59,3 +66,17 @@ def created_task(client, sample_task):
     """Fixture that creates a task and returns it."""
     response = client.post('/tasks', json=sample_task())
     return response.get_json()
+
+
+@pytest.fixture
+def wait_for_job(client):
+    """Fixture that polls a background job until it finishes and returns it."""
+    def _wait(job_id, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            job = client.get(f'/jobs/{job_id}').get_json()
+            if job['status'] in ('completed', 'failed'):
+                return job
+            time.sleep(0.01)
+        raise TimeoutError(f'Job {job_id} did not finish within {timeout}s')
+    return _wait
@@ -2,6 +2,7 @@
 API endpoint tests for the Task Manager application.
 """
 import pytest
+from datetime import datetime, timedelta, timezone
 
 
 class TestGetTasks:
@@ -259,3 +260,238 @@ class TestGetStats:
         assert data['total'] == 1
         assert data['completed'] == 0
         assert data['pending'] == 1
+
+
+class TestBulkOperations:
+    """Tests for predicate-based bulk operations and GET /jobs/<id>."""
+
+    def test_delete_completed_tasks(self, client, sample_task, wait_for_job):
+        """Test deleting all completed tasks in a background job."""
+        task1 = client.post('/tasks', json=sample_task(title="Task 1")).get_json()
+        task2 = client.post('/tasks', json=sample_task(title="Task 2")).get_json()
+        client.post('/tasks', json=sample_task(title="Task 3"))
+        client.put(f'/tasks/{task1["id"]}/complete')
+        client.put(f'/tasks/{task2["id"]}/complete')
+
+        response = client.delete('/tasks?completed=true')
+        assert response.status_code == 202
+        job = response.get_json()
+        assert job['operation'] == 'delete'
+
+        job = wait_for_job(job['id'])
+        assert job['status'] == 'completed'
+        assert job['total'] == 3
+        assert job['processed'] == 3
+        assert job['affected'] == 2
+        assert sorted(job['task_ids']) == [task1['id'], task2['id']]
+
+        remaining = client.get('/tasks').get_json()
+        assert [t['title'] for t in remaining] == ["Task 3"]
+
+    def test_complete_tasks_by_title(self, client, sample_task, wait_for_job):
+        """Test completing all tasks whose title contains a filter string."""
+        client.post('/tasks', json=sample_task(title="Write report"))
+        client.post('/tasks', json=sample_task(title="Buy milk"))
+        client.post('/tasks', json=sample_task(title="Review REPORT"))
+
+        response = client.put('/tasks/complete?title=report')
+        assert response.status_code == 202
+
+        job = wait_for_job(response.get_json()['id'])
+        assert job['status'] == 'completed'
+        assert sorted(job['task_ids']) == [1, 3]
+
+        stats = client.get('/tasks/stats').get_json()
+        assert stats == {'total': 3, 'completed': 2, 'pending': 1, 'overdue': 0}
+
+    def test_complete_skips_already_completed(self, client, created_task, wait_for_job):
+        """Test that bulk completion only reports tasks it changed."""
+        client.put(f'/tasks/{created_task["id"]}/complete')
+
+        response = client.put('/tasks/complete?title=Test')
+        job = wait_for_job(response.get_json()['id'])
+        assert job['processed'] == 1
+        assert job['task_ids'] == []
+
+    def test_bulk_processes_in_chunks(self, client, wait_for_job, monkeypatch):
+        """Test that jobs larger than one chunk process every task."""
+        from app import jobs
+        monkeypatch.setattr(jobs, 'chunk_size', 7)
+
+        for i in range(50):
+            client.post('/tasks', json={'title': f'Task {i}'})
+
+        response = client.delete('/tasks?completed=false')
+        job = wait_for_job(response.get_json()['id'])
+        assert job['processed'] == 50
+        assert len(job['task_ids']) == 50
+        assert client.get('/tasks').get_json() == []
+
+    def test_bulk_requires_filter(self, client, created_task):
+        """Test that a bulk operation without a filter is rejected."""
+        response = client.delete('/tasks')
+        assert response.status_code == 400
+        assert 'error' in response.get_json()
+
+        # Nothing should have been deleted
+        assert len(client.get('/tasks').get_json()) == 1
+
+    def test_bulk_invalid_filter(self, client):
+        """Test that an invalid filter value is rejected."""
+        response = client.delete('/tasks?completed=maybe')
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data['details'][0]['field'] == 'completed'
+
+    def test_task_ids_capped(self, client, wait_for_job, monkeypatch):
+        """Test that jobs count every affected task but cap the recorded IDs."""
+        from app import jobs
+        monkeypatch.setattr(jobs, 'chunk_size', 4)
+        monkeypatch.setattr(jobs, 'max_task_ids', 5)
+
+        for i in range(12):
+            client.post('/tasks', json={'title': f'Task {i}'})
+
+        job = wait_for_job(client.delete('/tasks?completed=false').get_json()['id'])
+        assert job['affected'] == 12
+        assert job['task_ids'] == [1, 2, 3, 4, 5]
+
+    def test_finished_jobs_are_evicted(self, client, wait_for_job, monkeypatch):
+        """Test that only the most recent finished jobs are kept."""
+        from app import jobs
+        monkeypatch.setattr(jobs, 'max_finished', 2)
+
+        job_ids = []
+        for _ in range(3):
+            job_ids.append(client.delete('/tasks?completed=true').get_json()['id'])
+            wait_for_job(job_ids[-1])
+
+        assert client.get(f'/jobs/{job_ids[0]}').status_code == 404
+        assert client.get(f'/jobs/{job_ids[1]}').status_code == 200
+        assert client.get(f'/jobs/{job_ids[2]}').status_code == 200
+
+    def test_bulk_unknown_filter(self, client, created_task):
+        """Test that a misspelled filter is rejected instead of ignored."""
+        client.put(f'/tasks/{created_task["id"]}/complete')
+
+        response = client.delete('/tasks?completed=true&titel=draft')
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data['details'][0]['field'] == 'titel'
+
+        # Nothing should have been deleted
+        assert len(client.get('/tasks').get_json()) == 1
+
+    def test_bulk_repeated_filter(self, client, created_task):
+        """Test that a filter given more than once is rejected."""
+        response = client.delete('/tasks?completed=true&completed=false')
+        assert response.status_code == 400
+        assert 'completed' in response.get_json()['error']
+
+        assert len(client.get('/tasks').get_json()) == 1
+
+    def test_get_nonexistent_job(self, client):
+        """Test getting a job that doesn't exist."""
+        response = client.get('/jobs/999')
+        assert response.status_code == 404
+        data = response.get_json()
+        assert 'error' in data
+
+
+class TestDueDates:
+    """Tests for due dates, GET /tasks/overdue and GET /tasks/upcoming."""
+
+    PAST = '2000-01-01T00:00:00Z'
+    FUTURE = '2999-01-01T00:00:00Z'
+
+    def create_due_in(self, client, title, **delta):
+        """Create a task due relative to now."""
+        due_at = (datetime.now(timezone.utc) + timedelta(**delta)).isoformat()
+        return client.post('/tasks', json={'title': title, 'due_at': due_at}).get_json()
+
+    def test_create_task_with_due_date(self, client):
+        """Test creating a task with a due date in another timezone."""
+        response = client.post('/tasks', json={'title': 'Task', 'due_at': '2030-06-01T12:00:00+02:00'})
+        assert response.status_code == 201
+        data = response.get_json()
+        assert data['due_at'] == '2030-06-01T10:00:00Z'
+
+    def test_create_task_invalid_due_date(self, client):
+        """Test creating a task with an unparseable due date."""
+        response = client.post('/tasks', json={'title': 'Task', 'due_at': 'tomorrow'})
+        assert response.status_code == 400
+        assert response.get_json()['details'][0]['field'] == 'due_at'
+
+    def test_create_task_due_date_out_of_range(self, client):
+        """Test creating a task whose due date overflows when converted to UTC."""
+        response = client.post('/tasks', json={'title': 'Task', 'due_at': '9999-12-31T23:59:59-05:00'})
+        assert response.status_code == 400
+        assert response.get_json()['details'][0]['field'] == 'due_at'
+
+    def test_overdue_tasks_ordered(self, client):
+        """Test that overdue lists only pending past-due tasks, oldest first."""
+        client.post('/tasks', json={'title': 'Recent', 'due_at': '2001-01-01T00:00:00Z'})
+        client.post('/tasks', json={'title': 'Oldest', 'due_at': self.PAST})
+        client.post('/tasks', json={'title': 'Future', 'due_at': self.FUTURE})
+        client.post('/tasks', json={'title': 'No due date'})
+
+        response = client.get('/tasks/overdue')
+        assert response.status_code == 200
+        assert [t['title'] for t in response.get_json()] == ['Oldest', 'Recent']
+
+    def test_upcoming_within_window(self, client):
+        """Test that upcoming lists tasks due inside the window, soonest first."""
+        self.create_due_in(client, 'In two hours', hours=2)
+        self.create_due_in(client, 'In one hour', hours=1)
+        self.create_due_in(client, 'Next week', days=7)
+        client.post('/tasks', json={'title': 'Overdue', 'due_at': self.PAST})
+
+        response = client.get('/tasks/upcoming?within=10800')
+        assert response.status_code == 200
+        assert [t['title'] for t in response.get_json()] == ['In one hour', 'In two hours']
+
+        response = client.get('/tasks/upcoming?within=P8D')
+        assert [t['title'] for t in response.get_json()] == ['In one hour', 'In two hours', 'Next week']
+
+    def test_upcoming_very_large_window(self, client):
+        """Test that a window reaching past the maximum date covers all future tasks."""
+        client.post('/tasks', json={'title': 'Far future', 'due_at': self.FUTURE})
+        client.post('/tasks', json={'title': 'Overdue', 'due_at': self.PAST})
+
+        response = client.get('/tasks/upcoming?within=1e13')
+        assert response.status_code == 200
+        assert [t['title'] for t in response.get_json()] == ['Far future']
+
+    def test_upcoming_invalid_window(self, client):
+        """Test that a non-positive or malformed window is rejected."""
+        assert client.get('/tasks/upcoming?within=0').status_code == 400
+        assert client.get('/tasks/upcoming?within=soon').status_code == 400
+
+    def test_complete_and_delete_leave_index(self, client):
+        """Test that completed and deleted tasks are no longer overdue."""
+        task1 = client.post('/tasks', json={'title': 'Task 1', 'due_at': self.PAST}).get_json()
+        task2 = client.post('/tasks', json={'title': 'Task 2', 'due_at': self.PAST}).get_json()
+        client.post('/tasks', json={'title': 'Task 3', 'due_at': self.PAST})
+        assert client.get('/tasks/stats').get_json()['overdue'] == 3
+
+        client.put(f'/tasks/{task1["id"]}/complete')
+        client.delete(f'/tasks/{task2["id"]}')
+
+        assert [t['title'] for t in client.get('/tasks/overdue').get_json()] == ['Task 3']
+        stats = client.get('/tasks/stats').get_json()
+        assert stats == {'total': 2, 'completed': 1, 'pending': 1, 'overdue': 1}
+
+    def test_bulk_jobs_maintain_index(self, client, wait_for_job):
+        """Test that bulk operations keep overdue counts in sync."""
+        client.post('/tasks', json={'title': 'Pay rent', 'due_at': self.PAST})
+        client.post('/tasks', json={'title': 'Pay bills', 'due_at': self.PAST})
+        client.post('/tasks', json={'title': 'Read book', 'due_at': self.PAST})
+
+        job = client.put('/tasks/complete?title=pay').get_json()
+        wait_for_job(job['id'])
+        assert client.get('/tasks/stats').get_json()['overdue'] == 1
+
+        job = client.delete('/tasks?completed=false').get_json()
+        wait_for_job(job['id'])
+        stats = client.get('/tasks/stats').get_json()
+        assert stats == {'total': 2, 'completed': 2, 'pending': 0, 'overdue': 0}
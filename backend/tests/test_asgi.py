@@ -0,0 +1,84 @@
+"""
+Tests for the ASGI serving mode.
+"""
+import asyncio
+import json
+
+import pytest
+
+from asgi import asgi_app
+
+
+def asgi_request(method, path, body=None):
+    """Drive one request through the ASGI app and return (status, json)."""
+    path, _, query = path.partition('?')
+    payload = json.dumps(body).encode() if body is not None else b''
+    headers = [(b'host', b'localhost')]
+    if body is not None:
+        headers.append((b'content-type', b'application/json'))
+        headers.append((b'content-length', str(len(payload)).encode()))
+
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': method,
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': query.encode(),
+        'root_path': '',
+        'headers': headers,
+        'client': ('127.0.0.1', 12345),
+        'server': ('localhost', 5000),
+    }
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': payload, 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(asgi_app(scope, receive, send))
+
+    status = messages[0]['status']
+    data = b''.join(m.get('body', b'') for m in messages[1:])
+    return status, json.loads(data)
+
+
+class TestAsgiApp:
+    """Tests that the ASGI app serves the same routes as the WSGI app."""
+
+    def test_create_and_list_tasks(self):
+        """Test creating a task and listing it through the ASGI app."""
+        status, task = asgi_request('POST', '/tasks', {'title': '  ASGI Task  '})
+        assert status == 201
+        assert task == {'id': 1, 'title': 'ASGI Task', 'completed': False, 'due_at': None}
+
+        status, tasks = asgi_request('GET', '/tasks')
+        assert status == 200
+        assert tasks == [task]
+
+    def test_shares_store_with_wsgi(self, client):
+        """Test that both serving modes read and write the same store."""
+        client.post('/tasks', json={'title': 'WSGI Task'})
+
+        status, task = asgi_request('PUT', '/tasks/1/complete')
+        assert status == 200
+        assert task['completed'] is True
+
+        stats = client.get('/tasks/stats').get_json()
+        assert stats == {'total': 1, 'completed': 1, 'pending': 0, 'overdue': 0}
+
+    def test_validation_error(self):
+        """Test that validation errors are returned through the ASGI app."""
+        status, data = asgi_request('POST', '/tasks', {'title': ''})
+        assert status == 400
+        assert 'error' in data
+
+    def test_not_found(self):
+        """Test that missing tasks return 404 through the ASGI app."""
+        status, data = asgi_request('DELETE', '/tasks/999')
+        assert status == 404
+        assert 'error' in data
@@ -0,0 +1,114 @@
+"""
+Tests for the time-ordered due date index.
+"""
+import random
+
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from due_index import DueIndex
+
+T0 = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+def at(minutes):
+    """Return a time the given number of minutes after T0."""
+    return T0 + timedelta(minutes=minutes)
+
+
+class TestDueIndex:
+    """Tests for DueIndex."""
+
+    def test_overdue_advances_with_time(self):
+        """Test that entries become overdue as the clock passes them."""
+        index = DueIndex()
+        index.add(at(10), 1)
+        index.add(at(20), 2)
+        index.add(at(30), 3)
+
+        assert index.overdue_count(at(0)) == 0
+        assert index.overdue_count(at(20)) == 2
+        assert index.overdue(at(25)) == [1, 2]
+        assert index.overdue_count(at(60)) == 3
+
+    def test_add_and_remove_behind_boundary(self):
+        """Test that the overdue count tracks changes to already-overdue entries."""
+        index = DueIndex()
+        index.add(at(10), 1)
+        assert index.overdue_count(at(15)) == 1
+
+        index.add(at(5), 2)
+        assert index.overdue_count(at(15)) == 2
+
+        index.remove(at(10), 1)
+        assert index.overdue(at(15)) == [2]
+
+    def test_remove_missing_entry(self):
+        """Test that removing an unknown entry is a no-op."""
+        index = DueIndex()
+        index.add(at(10), 1)
+        index.overdue_count(at(15))
+
+        index.remove(at(10), 2)
+        assert index.overdue_count(at(15)) == 1
+
+    def test_clock_going_backwards(self):
+        """Test that queries stay correct if the clock moves backwards."""
+        index = DueIndex()
+        index.add(at(10), 1)
+        index.add(at(20), 2)
+
+        assert index.overdue_count(at(25)) == 2
+        assert index.overdue_count(at(15)) == 1
+
+    def test_upcoming_window(self):
+        """Test that upcoming covers (now, now + within], soonest first."""
+        index = DueIndex()
+        index.add(at(30), 3)
+        index.add(at(10), 1)
+        index.add(at(20), 2)
+
+        assert index.upcoming(at(10), timedelta(minutes=20)) == [2, 3]
+        assert index.upcoming(at(0), timedelta(minutes=15)) == [1]
+
+    def test_upcoming_past_max_date(self):
+        """Test that a window overflowing the datetime range does not raise."""
+        index = DueIndex()
+        index.add(at(10), 1)
+
+        assert index.upcoming(at(0), timedelta.max) == [1]
+
+    def test_same_due_date(self):
+        """Test that tasks sharing a due date are ordered by ID."""
+        index = DueIndex()
+        index.add(at(10), 2)
+        index.add(at(10), 1)
+
+        assert index.overdue(at(10)) == [1, 2]
+        index.remove(at(10), 2)
+        assert index.overdue(at(10)) == [1]
+
+    def test_matches_brute_force_across_blocks(self):
+        """Test that block splits and removals keep queries consistent with a plain list."""
+        rng = random.Random(0)
+        index = DueIndex(load=2)
+        expected = set()
+        now = 0
+
+        for task_id in range(300):
+            if expected and rng.random() < 0.4:
+                entry = rng.choice(sorted(expected))
+                expected.discard(entry)
+                index.remove(*entry)
+            else:
+                entry = (at(rng.randrange(200)), task_id)
+                expected.add(entry)
+                index.add(*entry)
+            now += rng.choice([0, 1])
+
+            ordered = sorted(expected)
+            overdue = [task_id for due_at, task_id in ordered if due_at <= at(now)]
+            upcoming = [task_id for due_at, task_id in ordered if at(now) < due_at <= at(now + 30)]
+            assert index.overdue_count(at(now)) == len(overdue)
+            assert index.overdue(at(now)) == overdue
+            assert index.upcoming(at(now), timedelta(minutes=30)) == upcoming
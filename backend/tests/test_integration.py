@@ -81,37 +81,37 @@ class TestTaskLifecycle:
         """Test that stats remain accurate through various operations."""
         # Initial stats should be all zeros
         stats = client.get('/tasks/stats').get_json()
-        assert stats == {'total': 0, 'completed': 0, 'pending': 0}
+        assert stats == {'total': 0, 'completed': 0, 'pending': 0, 'overdue': 0}
 
         # Create first task
         task1 = client.post('/tasks', json={'title': 'Task 1'}).get_json()
         stats = client.get('/tasks/stats').get_json()
-        assert stats == {'total': 1, 'completed': 0, 'pending': 1}
+        assert stats == {'total': 1, 'completed': 0, 'pending': 1, 'overdue': 0}
 
         # Create second task
         task2 = client.post('/tasks', json={'title': 'Task 2'}).get_json()
         stats = client.get('/tasks/stats').get_json()
-        assert stats == {'total': 2, 'completed': 0, 'pending': 2}
+        assert stats == {'total': 2, 'completed': 0, 'pending': 2, 'overdue': 0}
 
         # Complete first task
         client.put(f'/tasks/{task1["id"]}/complete')
         stats = client.get('/tasks/stats').get_json()
-        assert stats == {'total': 2, 'completed': 1, 'pending': 1}
+        assert stats == {'total': 2, 'completed': 1, 'pending': 1, 'overdue': 0}
 
         # Complete second task
         client.put(f'/tasks/{task2["id"]}/complete')
         stats = client.get('/tasks/stats').get_json()
-        assert stats == {'total': 2, 'completed': 2, 'pending': 0}
+        assert stats == {'total': 2, 'completed': 2, 'pending': 0, 'overdue': 0}
 
         # Delete first task
         client.delete(f'/tasks/{task1["id"]}')
         stats = client.get('/tasks/stats').get_json()
-        assert stats == {'total': 1, 'completed': 1, 'pending': 0}
+        assert stats == {'total': 1, 'completed': 1, 'pending': 0, 'overdue': 0}
 
         # Delete second task
         client.delete(f'/tasks/{task2["id"]}')
         stats = client.get('/tasks/stats').get_json()
-        assert stats == {'total': 0, 'completed': 0, 'pending': 0}
+        assert stats == {'total': 0, 'completed': 0, 'pending': 0, 'overdue': 0}
 
     def test_task_id_increment(self, client):
         """Test that task IDs increment correctly."""
@@ -160,4 +160,4 @@ class TestTaskLifecycle:
 
         # Final stats should be zeros
         stats = client.get('/tasks/stats').get_json()
-        assert stats == {'total': 0, 'completed': 0, 'pending': 0}
+        assert stats == {'total': 0, 'completed': 0, 'pending': 0, 'overdue': 0}
@@ -2,8 +2,9 @@
 Pydantic model validation tests.
 """
 import pytest
+from datetime import timedelta, timezone
 from pydantic import ValidationError
-from models import TaskCreate, TaskResponse, StatsResponse
+from models import TaskCreate, TaskResponse, StatsResponse, TaskFilter, JobResponse, UpcomingQuery
 
 
 class TestTaskCreate:
@@ -49,6 +50,30 @@ class TestTaskCreate:
         errors = exc_info.value.errors()
         assert any('title' in str(e) for e in errors)
 
+    def test_due_at_optional(self):
+        """Test that due date defaults to None."""
+        assert TaskCreate(title="Test Task").due_at is None
+
+    def test_due_at_naive_assumed_utc(self):
+        """Test that a due date without offset is treated as UTC."""
+        task = TaskCreate(title="Test Task", due_at="2030-01-01T09:00:00")
+        assert task.due_at.tzinfo == timezone.utc
+        assert task.due_at.hour == 9
+
+    def test_due_at_converted_to_utc(self):
+        """Test that a due date with an offset is converted to UTC."""
+        task = TaskCreate(title="Test Task", due_at="2030-01-01T09:00:00-05:00")
+        assert task.due_at.tzinfo == timezone.utc
+        assert task.due_at.hour == 14
+
+    @pytest.mark.parametrize('due_at', ['0001-01-01T00:00:00+01:00', '9999-12-31T23:59:59-05:00'])
+    def test_due_at_out_of_range_in_utc(self, due_at):
+        """Test that a due date that cannot be converted to UTC raises validation error."""
+        with pytest.raises(ValidationError) as exc_info:
+            TaskCreate(title="Test Task", due_at=due_at)
+        errors = exc_info.value.errors()
+        assert any('due_at' in str(e) for e in errors)
+
 
 class TestTaskResponse:
     """Tests for TaskResponse model."""
@@ -73,25 +98,95 @@ class TestStatsResponse:
     def test_stats_negative_total(self):
         """Test that negative total raises validation error."""
         with pytest.raises(ValidationError) as exc_info:
-            StatsResponse(total=-1, completed=0, pending=0)
+            StatsResponse(total=-1, completed=0, pending=0, overdue=0)
         errors = exc_info.value.errors()
         assert any('total' in str(e) for e in errors)
 
     def test_stats_negative_completed(self):
         """Test that negative completed raises validation error."""
         with pytest.raises(ValidationError) as exc_info:
-            StatsResponse(total=5, completed=-1, pending=5)
+            StatsResponse(total=5, completed=-1, pending=5, overdue=0)
         errors = exc_info.value.errors()
         assert any('completed' in str(e) for e in errors)
 
     def test_stats_negative_pending(self):
         """Test that negative pending raises validation error."""
         with pytest.raises(ValidationError) as exc_info:
-            StatsResponse(total=5, completed=5, pending=-1)
+            StatsResponse(total=5, completed=5, pending=-1, overdue=0)
         errors = exc_info.value.errors()
         assert any('pending' in str(e) for e in errors)
 
     def test_stats_missing_field(self):
         """Test that missing required field raises validation error."""
         with pytest.raises(ValidationError):
-            StatsResponse(total=5, completed=2)  # Missing pending
+            StatsResponse(total=5, completed=2, overdue=0)  # Missing pending
+
+    def test_stats_negative_overdue(self):
+        """Test that negative overdue raises validation error."""
+        with pytest.raises(ValidationError) as exc_info:
+            StatsResponse(total=5, completed=2, pending=3, overdue=-1)
+        errors = exc_info.value.errors()
+        assert any('overdue' in str(e) for e in errors)
+
+
+class TestUpcomingQuery:
+    """Tests for UpcomingQuery model."""
+
+    def test_default_window(self):
+        """Test that the window defaults to one day."""
+        assert UpcomingQuery().within == timedelta(days=1)
+
+    def test_window_in_seconds(self):
+        """Test that a plain number is read as seconds."""
+        assert UpcomingQuery(within='3600').within == timedelta(hours=1)
+
+    def test_window_iso_duration(self):
+        """Test that an ISO 8601 duration is accepted."""
+        assert UpcomingQuery(within='PT2H').within == timedelta(hours=2)
+
+    def test_window_must_be_positive(self):
+        """Test that a zero window raises validation error."""
+        with pytest.raises(ValidationError):
+            UpcomingQuery(within='0')
+
+
+class TestTaskFilter:
+    """Tests for TaskFilter model."""
+
+    def test_empty_filter(self):
+        """Test that a filter without predicates is reported as empty."""
+        assert TaskFilter().is_empty()
+
+    def test_completed_from_query_string(self):
+        """Test that query-string booleans are parsed."""
+        assert TaskFilter(completed='true').completed is True
+        assert TaskFilter(completed='false').completed is False
+
+    def test_matches_title_case_insensitive(self):
+        """Test that title matching is a case-insensitive substring match."""
+        task_filter = TaskFilter(title='report')
+        assert task_filter.matches({'id': 1, 'title': 'Write REPORT', 'completed': False})
+        assert not task_filter.matches({'id': 2, 'title': 'Buy milk', 'completed': False})
+
+    def test_matches_all_predicates(self):
+        """Test that every given predicate must match."""
+        task_filter = TaskFilter(title='report', completed=True)
+        assert not task_filter.matches({'id': 1, 'title': 'Write report', 'completed': False})
+        assert task_filter.matches({'id': 1, 'title': 'Write report', 'completed': True})
+
+    def test_unknown_field(self):
+        """Test that an unknown filter raises validation error."""
+        with pytest.raises(ValidationError) as exc_info:
+            TaskFilter(completed='true', titel='draft')
+        errors = exc_info.value.errors()
+        assert any('titel' in str(e) for e in errors)
+
+
+class TestJobResponse:
+    """Tests for JobResponse model."""
+
+    def test_invalid_status(self):
+        """Test that an unknown job status raises validation error."""
+        with pytest.raises(ValidationError):
+            JobResponse(id=1, operation='delete', status='unknown',
+                        total=0, processed=0, affected=0, task_ids=[])